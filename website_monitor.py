@@ -12,15 +12,46 @@ import os
 import json
 import hashlib
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import smtplib
+import heapq
 import html
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from datetime import datetime
-from typing import Optional
-from bs4 import BeautifulSoup, Comment
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+try:
+    import lxml  # noqa: F401 - only needed as a BeautifulSoup backend
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Stored hashes are tagged with their algorithm so a change of algorithm can be detected
+HASH_PREFIX = "blake2b:"
+# Response bodies are streamed in chunks of this size and truncated beyond 'max_bytes'
+CHUNK_SIZE = 64 * 1024
+DEFAULT_MAX_BYTES = 5_000_000
+# Seconds to wait on the SMTP server before giving up on a connection
+SMTP_TIMEOUT = 30
+# Stable sites back off from 'check_interval' up to 'max_check_interval'
+DEFAULT_MAX_CHECK_INTERVAL = 24 * 3600
+
+_WS_RE = re.compile(r'\s+')
+# Common UI noise; word boundaries keep e.g. "ad" from eating into "administration"
+_NOISE_RE = re.compile(
+    r'\b(cookie|privacy|accept|decline|login|sign up|subscribe|menu|search|advertisement|ad)\b',
+    re.I)
+_SENT_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+# Class/id fragments that mark elements whose content changes on every page load
+_DYNAMIC_RE = re.compile(r'timestamp|time|date|session|csrf|token|nonce|updated|modified', re.I)
+# Selectors of the form "tag", "#id" or ".class" can be applied while parsing
+_SIMPLE_SELECTOR_RE = re.compile(r'([#.]?)([\w-]+)')
 
 
 class WebsiteMonitor:
@@ -35,6 +66,37 @@ class WebsiteMonitor:
         self.data_file = "website_data.json"
         self.config = self.load_config()
         self.website_data = self.load_website_data()
+        self.data_lock = threading.Lock()
+        self.print_lock = threading.Lock()
+        self.last_cycle_start = None
+        self.session = self.create_session()
+
+    def log_site(self, name: str, message: str):
+        """
+        Print a status line for one site. Sites are checked concurrently, so every line is
+        tagged with the site name and printed whole.
+
+        Args:
+            name (str): Site name (or URL) the message refers to.
+            message (str): Status message.
+        """
+        with self.print_lock:
+            print(f"[{name}] {message}")
+
+    def create_session(self) -> requests.Session:
+        """
+        Build a persistent HTTP session so connections (and TLS handshakes) are reused
+        across sites and check cycles.
+
+        Returns:
+            requests.Session: Session with pooled adapters and default headers set.
+        """
+        session = requests.Session()
+        session.headers['User-Agent'] = self.config.get('user_agent', '')
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=2)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
 
     def load_config(self) -> dict:
         """
@@ -63,10 +125,12 @@ class WebsiteMonitor:
                     }
                 },
                 "check_interval": 3600,
+                "max_check_interval": DEFAULT_MAX_CHECK_INTERVAL,
                 "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
                               "(KHTML, like Gecko) Chrome/130.0 Safari/537.36",
                 "ignore_dynamic_content": True,
-                "min_change_chars": 50
+                "min_change_chars": 50,
+                "max_bytes": DEFAULT_MAX_BYTES
             }
             with open(self.config_file, 'w') as f:
                 json.dump(default_config, f, indent=4)
@@ -91,131 +155,199 @@ class WebsiteMonitor:
     def save_website_data(self):
         """
         Save the current website data (hashes, timestamps, clean text, etc.) to disk.
+        Written compactly to a temporary file and swapped in, so a crash mid-write
+        cannot corrupt the existing state.
         """
-        with open(self.data_file, 'w') as f:
-            json.dump(self.website_data, f, indent=4)
+        tmp_file = self.data_file + '.tmp'
+        with open(tmp_file, 'w') as f:
+            json.dump(self.website_data, f, separators=(',', ':'))
+        os.replace(tmp_file, self.data_file)
 
-    def normalize_content(self, content: str) -> str:
+    def normalize_content(self, soup: Tag):
         """
         Remove dynamic and noisy HTML elements that commonly change without meaningful updates
         (scripts, timestamps, session IDs, etc.) before hashing and comparison.
+        The parse tree is modified in place.
 
         Args:
-            content (str): Raw HTML content from the webpage.
-
-        Returns:
-            str: Normalized HTML string suitable for reliable change detection.
+            soup (Tag): Parsed HTML of the webpage.
         """
         if not self.config.get('ignore_dynamic_content', True):
-            return content
-        try:
-            soup = BeautifulSoup(content, 'html.parser')
-            # Remove scripts, styles, etc.
-            for tag in soup(['script', 'style', 'noscript', 'svg', 'meta', 'link']):
+            return
+        # Remove scripts, styles, etc.
+        for tag in soup(['script', 'style', 'noscript', 'svg', 'meta', 'link']):
+            tag.decompose()
+        # Remove elements with dynamic patterns in their class or id
+        for tag in soup.find_all(True):
+            if tag.decomposed:
+                continue  # Inside an element that was already removed
+            classes = tag.get('class')
+            marker = (' '.join(classes) if classes else '') + ' ' + (tag.get('id') or '')
+            if _DYNAMIC_RE.search(marker):
                 tag.decompose()
-            # Remove elements with dynamic patterns
-            patterns = ['timestamp', 'time', 'date', 'session', 'csrf', 'token', 'nonce', 'updated', 'modified']
-            for tag in soup.find_all(True):
-                if tag.get('class') and any(p in ' '.join(tag['class']).lower() for p in patterns):
-                    tag.decompose()
-                if tag.get('id') and any(p in tag.get('id', '').lower() for p in patterns):
-                    tag.decompose()
-            return str(soup)
-        except:
-            return content
-
-    def get_clean_text(self, content: str) -> str:
+
+    def get_clean_text(self, soup: Tag) -> str:
         """
         Extract only visible, meaningful human-readable text from HTML.
         Removes images, figures, captions, navigation, ads, and HTML fragments.
-        Used for change detection and email previews.
+        Used for change detection and email previews. The parse tree is modified in place.
 
         Args:
-            content (str): HTML content (normalized or raw).
+            soup (Tag): Parsed HTML (normalized or raw).
 
         Returns:
             str: Clean plain text string.
         """
         try:
-            soup = BeautifulSoup(content, 'html.parser')
-
             # Remove all noisy tags completely
             for tag in soup(['script', 'style', 'noscript', 'svg', 'meta', 'link',
                              'img', 'figure', 'figcaption', 'nav', 'header', 'footer', 'aside']):
                 tag.decompose()
 
-            # Collect only visible text nodes
-            texts = []
-            for element in soup.find_all(text=True):
-                if element.parent.name in ['script', 'style']:
-                    continue
-                if isinstance(element, Comment):
-                    continue
-                text = element.strip()
-                if text:
-                    texts.append(text)
+            # Collect only visible text nodes (get_text() skips comments)
+            full_text = soup.get_text(separator=' ', strip=True)
 
-            full_text = ' '.join(texts)
-            full_text = re.sub(r'\s+', ' ', full_text).strip()
-
-            # Remove common UI noise
-            full_text = re.sub(r'(cookie|privacy|accept|decline|login|sign up|subscribe|menu|search|advertisement|ad)', '', full_text, flags=re.I)
-            full_text = re.sub(r'\s+', ' ', full_text).strip()
+            # Remove common UI noise, then collapse whitespace in a single pass
+            full_text = _NOISE_RE.sub('', full_text)
+            full_text = _WS_RE.sub(' ', full_text).strip()
 
             return full_text or "No visible text"
-        except:
+        except Exception:
             return "Error extracting clean text"
 
-    def fetch_website_content(self, url: str, selector: Optional[str] = None) -> Optional[str]:
+    def _get_strainer(self, selector: Optional[str]) -> Optional[SoupStrainer]:
         """
-        Fetch the webpage content and apply normalization.
-        If a CSS selector is provided, limit comparison to that section.
+        Build a SoupStrainer equivalent to a simple CSS selector, so only the monitored
+        part of the page is parsed.
 
         Args:
-            url (str): The URL to fetch.
-            selector (str or None): Optional CSS selector to monitor a specific part of the page.
+            selector (str or None): CSS selector from the website config.
 
         Returns:
-            str or None: Normalized HTML content, or None if fetch failed.
+            SoupStrainer or None: Strainer for "tag", "#id" or ".class" selectors, None otherwise.
         """
-        try:
-            headers = {'User-Agent': self.config.get('user_agent', '')}
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            content = self.normalize_content(response.text)
-            if selector:
-                soup = BeautifulSoup(content, 'html.parser')
+        match = _SIMPLE_SELECTOR_RE.fullmatch(selector.strip()) if selector else None
+        if not match:
+            return None
+        prefix, value = match.groups()
+        if prefix == '#':
+            return SoupStrainer(attrs={'id': value})
+        if prefix == '.':
+            return SoupStrainer(class_=value)
+        return SoupStrainer(value.lower())  # Parsers lowercase tag names; CSS matches any case
+
+    def _parse_and_extract(self, content: str, selector: Optional[str] = None) -> Tuple[str, str]:
+        """
+        Parse the page once and derive both the normalized HTML and the clean text from it.
+        If a CSS selector is provided, both are limited to the first matching element, which is
+        picked before normalization: dynamic-looking elements are only removed inside it, so
+        the same element is monitored whether or not the selector could be applied while
+        parsing. If nothing matches, the whole page is used.
+
+        Args:
+            content (str): Raw HTML content from the webpage.
+            selector (str or None): Optional CSS selector to monitor a specific part of the page.
+
+        Returns:
+            tuple[str, str]: Normalized HTML (for hashing) and clean text (for diffs and previews).
+        """
+        strainer = self._get_strainer(selector)
+        soup = BeautifulSoup(content, HTML_PARSER, parse_only=strainer)
+        root = soup
+        if selector:
+            selected = soup.select(selector)
+            if not selected and strainer:
+                # The strainer found nothing - retry the selector on a full parse
+                root = soup = BeautifulSoup(content, HTML_PARSER)
                 selected = soup.select(selector)
-                if selected:
-                    content = str(selected[0])  # Use selected element for hashing/comparison
-            return content
+            if selected:
+                root = selected[0]  # Use selected element for hashing/comparison
+        self.normalize_content(root)
+        # Serialize before get_clean_text() strips further tags from the same tree
+        normalized = str(root)
+        return normalized, self.get_clean_text(root)
+
+    def fetch_website_content(self, url: str, prev: Optional[dict] = None,
+                              name: Optional[str] = None) -> Optional[dict]:
+        """
+        Fetch the raw webpage content, hashing the body as it is downloaded.
+        If validators (ETag / Last-Modified) from a previous check are available,
+        a conditional GET is made so unchanged pages come back as a bodiless 304.
+        For servers that ignore conditional requests, the body is not downloaded at all
+        when both the ETag and Content-Length match the previous response.
+
+        Args:
+            url (str): The URL to fetch.
+            prev (dict or None): Previously stored data for this URL, if any.
+            name (str or None): Site name used in status messages (defaults to the URL).
+
+        Returns:
+            dict or None: {'not_modified': <reason>} if the page is known to be unchanged,
+            otherwise a dict with the decoded 'text', the 'raw_hash' of the response body,
+            and the ETag, Last-Modified and Content-Length response headers as 'etag',
+            'last_modified' and 'http_content_length'. None if fetch failed.
+        """
+        headers = {}
+        if prev:
+            if prev.get('etag'):
+                headers['If-None-Match'] = prev['etag']
+            if prev.get('last_modified'):
+                headers['If-Modified-Since'] = prev['last_modified']
+        try:
+            with self.session.get(url, headers=headers, timeout=30, stream=True) as response:
+                if response.status_code == 304:
+                    return {'not_modified': '304 Not Modified'}
+                response.raise_for_status()
+                etag = response.headers.get('ETag')
+                http_content_length = response.headers.get('Content-Length')
+                if (prev and etag and http_content_length and etag == prev.get('etag')
+                        and http_content_length == prev.get('http_content_length')):
+                    return {'not_modified': 'ETag and size unchanged'}
+                # Hash the raw body while it streams in, so it is only held once in memory
+                max_bytes = self.config.get('max_bytes', DEFAULT_MAX_BYTES)
+                raw_hasher = hashlib.blake2b(digest_size=16)
+                body = bytearray()
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    raw_hasher.update(chunk)
+                    body.extend(chunk)
+                    if len(body) > max_bytes:
+                        self.log_site(name or url, f"Warning: response truncated after {len(body):,} bytes")
+                        break
+                text = body.decode(response.encoding or 'utf-8', errors='replace')
+            return {
+                'text': text,
+                'raw_hash': HASH_PREFIX + raw_hasher.hexdigest(),
+                'etag': etag,
+                'last_modified': response.headers.get('Last-Modified'),
+                'http_content_length': http_content_length,
+            }
         except Exception as e:
-            print(f"Error fetching {url}: {e}")
+            self.log_site(name or url, f"Error fetching {url}: {e}")
             return None
 
     def calculate_hash(self, content: str) -> str:
         """
-        Compute SHA-256 hash of the content for fast change detection.
+        Compute a BLAKE2b hash of the content for fast change detection.
 
         Args:
             content (str): Normalized content string.
 
         Returns:
-            str: Hexadecimal hash digest.
+            str: Hexadecimal hash digest, prefixed with HASH_PREFIX.
         """
-        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+        return HASH_PREFIX + hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
 
-    def get_content_snippet(self, content: str) -> str:
+    def get_content_snippet(self, clean_text: str) -> str:
         """
         Generate a clean, readable preview of the current page for inclusion in emails.
 
         Args:
-            content (str): HTML content.
+            clean_text (str): Clean text already extracted by get_clean_text().
 
         Returns:
             str: Truncated clean text preview (max 1000 chars).
         """
-        return self.get_clean_text(content)[:1000] + ("..." if len(self.get_clean_text(content)) > 1000 else "")
+        return clean_text[:1000] + ("..." if len(clean_text) > 1000 else "")
 
     def get_change_description(self, old_len: int, new_len: int) -> str:
         """
@@ -247,13 +379,13 @@ class WebsiteMonitor:
             list[str]: List of formatted "Added: ..." strings (up to 10).
         """
         def split_sentences(t: str):
-            return [s.strip() for s in re.split(r'(?<=[.!?])\s+(?=[A-Z])', t) if len(s.strip()) > 30]
+            return [s.strip() for s in _SENT_RE.split(t) if len(s.strip()) > 30]
 
         old_set = set(split_sentences(old_text))
         added = [s for s in split_sentences(new_text) if s not in old_set]
 
         diffs = []
-        for s in sorted(added, key=len, reverse=True)[:10]:
+        for s in heapq.nlargest(10, added, key=len):
             disp = s if len(s) <= 350 else s[:350] + "..."
             diffs.append(f"Added: \"{disp}\"")
 
@@ -272,26 +404,52 @@ class WebsiteMonitor:
         url = website['url']
         name = website.get('name', url)
         selector = website.get('selector')
-        print(f"Checking {name} ({url})...")
-        content = self.fetch_website_content(url, selector)
-        if content is None:
+        self.log_site(name, f"Checking {url}...")
+        result = self.fetch_website_content(url, self.website_data.get(url), name)
+        if result is None:
+            return None
+        if result.get('not_modified'):
+            self.log_site(name, f"No changes ({result['not_modified']})")
+            with self.data_lock:
+                self.website_data[url]['last_check'] = datetime.now().isoformat()
+            return None
+        # Byte-identical body: nothing to re-parse or compare
+        if result['raw_hash'] == self.website_data.get(url, {}).get('raw_hash'):
+            self.log_site(name, "No changes")
+            with self.data_lock:
+                self.website_data[url].update({
+                    'last_check': datetime.now().isoformat(),
+                    'etag': result['etag'], 'last_modified': result['last_modified'],
+                    'http_content_length': result['http_content_length']
+                })
+            return None
+        try:
+            content, clean_text = self._parse_and_extract(result['text'], selector)
+        except Exception as e:
+            self.log_site(name, f"Error parsing {url}: {e}")
             return None
         content_hash = self.calculate_hash(content)
-        clean_text = self.get_clean_text(content)
-        snippet = self.get_content_snippet(content)
+        snippet = self.get_content_snippet(clean_text)
         min_change = self.config.get('min_change_chars', 50)
 
-        if url in self.website_data:
+        if url in self.website_data and not self.website_data[url]['hash'].startswith(HASH_PREFIX):
+            self.log_site(name, "Stored hash uses an old format - baseline refreshed")
+        elif url in self.website_data:
             prev = self.website_data[url]
             if content_hash == prev['hash']:
-                print("  No changes")
-                self.website_data[url]['last_check'] = datetime.now().isoformat()
+                self.log_site(name, "No changes")
+                with self.data_lock:
+                    self.website_data[url].update({
+                        'last_check': datetime.now().isoformat(), 'raw_hash': result['raw_hash'],
+                        'etag': result['etag'], 'last_modified': result['last_modified'],
+                        'http_content_length': result['http_content_length']
+                    })
                 return None
-            size_diff = abs(len(content) - len(prev.get('full_content', '')))
+            size_diff = abs(len(content) - prev.get('content_len', 0))
             if size_diff < min_change:
-                print(f"  Tiny change ignored ({size_diff} chars)")
+                self.log_site(name, f"Tiny change ignored ({size_diff} chars)")
             else:
-                print("  New content detected!")
+                self.log_site(name, "New content detected!")
                 change_info = {
                     'url': url, 'name': name,
                     'previous_check': prev['last_check'],
@@ -300,53 +458,114 @@ class WebsiteMonitor:
                     'current_full_content': clean_text,
                     'current_snippet': snippet,
                 }
-                self.website_data[url] = {
-                    'hash': content_hash, 'last_check': datetime.now().isoformat(),
-                    'content_snippet': snippet, 'full_content': content, 'clean_text': clean_text
-                }
+                with self.data_lock:
+                    self.website_data[url] = {
+                        'hash': content_hash, 'last_check': datetime.now().isoformat(),
+                        'content_snippet': snippet, 'content_len': len(content), 'clean_text': clean_text,
+                        'raw_hash': result['raw_hash'],
+                        'etag': result['etag'], 'last_modified': result['last_modified'],
+                        'http_content_length': result['http_content_length']
+                    }
                 return change_info
         else:
-            print("  First check - baseline saved")
-
-        self.website_data[url] = {
-            'hash': content_hash, 'last_check': datetime.now().isoformat(),
-            'content_snippet': snippet, 'full_content': content, 'clean_text': clean_text
-        }
+            self.log_site(name, "First check - baseline saved")
+
+        with self.data_lock:
+            record = {
+                'hash': content_hash, 'last_check': datetime.now().isoformat(),
+                'content_snippet': snippet, 'content_len': len(content), 'clean_text': clean_text,
+                'raw_hash': result['raw_hash'],
+                'etag': result['etag'], 'last_modified': result['last_modified'],
+                'http_content_length': result['http_content_length']
+            }
+            # Keep the polling schedule: an ignored tiny change still counts as unchanged
+            for key in ('current_interval', 'next_check_at'):
+                if key in self.website_data.get(url, {}):
+                    record[key] = self.website_data[url][key]
+            self.website_data[url] = record
         return None
 
-    def send_email(self, subject: str, plain_text: str, html_text: str):
+    def connect_smtp(self) -> Optional[smtplib.SMTP_SSL]:
+        """
+        Open and authenticate an SMTP_SSL connection that can be reused for several emails.
+
+        Returns:
+            smtplib.SMTP_SSL or None: Logged-in connection, or None if connecting failed.
+        """
+        try:
+            cfg = self.config['notifications']['email']
+            server = smtplib.SMTP_SSL(cfg['smtp_server'], cfg['smtp_port'], timeout=SMTP_TIMEOUT)
+            server.login(cfg['sender_email'], cfg['sender_password'])
+            return server
+        except Exception as e:
+            print(f"  Email connection failed: {e}")
+            return None
+
+    def _send_via(self, server: smtplib.SMTP_SSL, subject: str, plain_text: str,
+                  html_text: str) -> Optional[smtplib.SMTP_SSL]:
         """
-        Send an email notification using SMTP_SSL.
+        Send an email notification over an already open SMTP connection.
+        If the server has dropped the connection, reconnect once and retry.
 
         Args:
+            server (smtplib.SMTP_SSL): Logged-in SMTP connection.
             subject (str): Email subject line.
             plain_text (str): Plain text body.
             html_text (str): HTML body.
+
+        Returns:
+            smtplib.SMTP_SSL or None: Connection to use for further emails (a new one after a
+            reconnect), or None if the connection was lost and could not be re-established.
         """
-        try:
-            cfg = self.config['notifications']['email']
-            msg = MIMEMultipart("alternative")
-            msg['Subject'] = subject
-            msg['From'] = cfg['sender_email']
-            msg['To'] = cfg['recipient_email']
+        cfg = self.config['notifications']['email']
+        msg = MIMEMultipart("alternative")
+        msg['Subject'] = subject
+        msg['From'] = cfg['sender_email']
+        msg['To'] = cfg['recipient_email']
 
-            msg.attach(MIMEText(plain_text, "plain", "utf-8"))
-            msg.attach(MIMEText(html_text, "html", "utf-8"))
+        msg.attach(MIMEText(plain_text, "plain", "utf-8"))
+        msg.attach(MIMEText(html_text, "html", "utf-8"))
 
-            server = smtplib.SMTP_SSL(cfg['smtp_server'], cfg['smtp_port'])
-            server.login(cfg['sender_email'], cfg['sender_password'])
-            server.send_message(msg)
-            server.quit()
+        try:
+            try:
+                server.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                print("  Email connection lost - reconnecting")
+                server.close()
+                server = self.connect_smtp()
+                if server is None:
+                    return None
+                server.send_message(msg)
             print("  Email sent successfully")
+        except smtplib.SMTPServerDisconnected as e:
+            print(f"  Email failed: {e}")
+            server.close()
+            return None
         except Exception as e:
             print(f"  Email failed: {e}")
+        return server
 
-    def send_notifications(self, change_info: dict):
+    def close_smtp(self, server: smtplib.SMTP_SSL):
         """
-        Compose and send email notification for a detected change.
+        Politely end an SMTP session, dropping the socket if the server has already gone.
+
+        Args:
+            server (smtplib.SMTP_SSL): Connection returned by connect_smtp().
+        """
+        try:
+            server.quit()
+        except smtplib.SMTPException:
+            server.close()
+
+    def compose_notification(self, change_info: dict) -> Tuple[str, str, str]:
+        """
+        Build the email for a detected change.
 
         Args:
             change_info (dict): Dictionary containing change details.
+
+        Returns:
+            tuple[str, str, str]: Subject, plain text body and HTML body.
         """
         subject = f"New Content – {change_info['name']}"
 
@@ -415,31 +634,142 @@ New additions:
 </body>
 </html>"""
 
+        return subject, plain_body, html_body
+
+    def send_notifications(self, change_info: dict):
+        """
+        Compose and send email notification for a detected change.
+
+        Args:
+            change_info (dict): Dictionary containing change details.
+        """
+        self.send_all_notifications([change_info])
+
+    def send_all_notifications(self, changes: list):
+        """
+        Send the notifications for every change in a check cycle over a single SMTP session.
+        If the server cannot be reached, this is reported once and the emails are skipped.
+
+        Args:
+            changes (list[dict]): Change information for each site with new content.
+        """
+        server = None
         if self.config['notifications']['email']['enabled']:
-            self.send_email(subject, plain_body, html_body)
+            server = self.connect_smtp()
+            if server is None:
+                print(f"  Skipping {len(changes)} email notification(s)")
+        for i, c in enumerate(changes):
+            print(f"→ {c['name']}")
+            if server is None:
+                continue
+            server = self._send_via(server, *self.compose_notification(c))
+            if server is None and i + 1 < len(changes):
+                print(f"  Skipping {len(changes) - i - 1} remaining email notification(s)")
+        if server is not None:
+            self.close_smtp(server)
+
+    def is_due(self, website: dict, now: datetime) -> bool:
+        """
+        Decide whether a site's adaptive polling interval has elapsed.
+
+        Args:
+            website (dict): Website entry from the config.
+            now (datetime): Start time of the current check cycle.
+
+        Returns:
+            bool: True if the site has no schedule yet or its next check time has passed.
+        """
+        next_check_at = self.website_data.get(website['url'], {}).get('next_check_at')
+        return next_check_at is None or now >= datetime.fromisoformat(next_check_at)
+
+    def schedule_next_check(self, url: str, changed: bool, cycle_start: datetime):
+        """
+        Work out when a site should next be checked: back to 'check_interval' when it changed,
+        otherwise double the current interval up to 'max_check_interval'. If the fetch failed,
+        the interval is left alone and the site is retried after 'check_interval'. Times count
+        from the start of the cycle, so sites checked together fall due together again.
+
+        Args:
+            url (str): URL of the site just checked.
+            changed (bool): Whether new content was detected.
+            cycle_start (datetime): Start time of the current check cycle.
+        """
+        base = self.config.get('check_interval', 3600)
+        max_interval = max(base, self.config.get('max_check_interval', DEFAULT_MAX_CHECK_INTERVAL))
+        with self.data_lock:
+            data = self.website_data.get(url)
+            if data is None:
+                return  # No baseline yet (fetch failed) - retried with the sites that have none
+            if datetime.fromisoformat(data['last_check']) < cycle_start:
+                # Fetch failed this cycle - don't treat it as unchanged, just retry
+                data['next_check_at'] = (cycle_start + timedelta(seconds=base)).isoformat()
+                return
+            if changed or 'current_interval' not in data:
+                interval = base
+            else:
+                interval = min(data['current_interval'] * 2, max_interval)
+            data['current_interval'] = interval
+            data['next_check_at'] = (cycle_start + timedelta(seconds=interval)).isoformat()
+
+    def seconds_until_next_check(self) -> float:
+        """
+        Time until the earliest scheduled site check. Sites without a schedule count as
+        due one 'check_interval' after the last cycle started.
+
+        Returns:
+            float: Seconds to sleep before the next check cycle (never negative).
+        """
+        now = datetime.now()
+        base = self.config.get('check_interval', 3600)
+        unscheduled_at = (self.last_cycle_start or now) + timedelta(seconds=base)
+        next_times = []
+        for site in self.config['websites']:
+            next_check_at = self.website_data.get(site['url'], {}).get('next_check_at')
+            if next_check_at is None:
+                next_times.append(unscheduled_at)
+            else:
+                next_times.append(datetime.fromisoformat(next_check_at))
+        if not next_times:
+            return base
+        return max(0.0, (min(next_times) - now).total_seconds())
 
-    def run_check(self):
+    def run_check(self, scheduled: bool = False):
         """
         Perform a single check of all configured websites.
         Saves state and sends notifications for any detected changes.
+
+        Args:
+            scheduled (bool): If True, only check sites whose adaptive polling interval has
+                elapsed and update their schedules. Otherwise every site is checked and the
+                stored schedules are left alone.
         """
+        cycle_start = self.last_cycle_start = datetime.now()
         print(f"\n{'='*60}")
-        print(f"Check started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"Check started: {cycle_start.strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"{'='*60}\n")
 
+        sites = self.config['websites']
+        if scheduled:
+            due = [site for site in sites if self.is_due(site, cycle_start)]
+            if len(due) < len(sites):
+                print(f"Skipping {len(sites) - len(due)} site(s) not yet due\n")
+            sites = due
+
+        # Fetches are I/O-bound and independent, so check sites concurrently
         changes = []
-        for site in self.config['websites']:
-            change_info = self.check_website(site)
-            if change_info is not None:
-                changes.append(change_info)
+        if sites:
+            with ThreadPoolExecutor(max_workers=min(16, len(sites))) as executor:
+                for site, change_info in zip(sites, executor.map(self.check_website, sites)):
+                    if scheduled:
+                        self.schedule_next_check(site['url'], change_info is not None, cycle_start)
+                    if change_info is not None:
+                        changes.append(change_info)
 
         self.save_website_data()
 
         if changes:
             print(f"\nNEW CONTENT on {len(changes)} site(s)!\n")
-            for c in changes:
-                print(f"→ {c['name']}")
-                self.send_notifications(c)
+            self.send_all_notifications(changes)
         else:
             print("No new content detected.")
 
@@ -448,18 +778,20 @@ New additions:
 
     def run_continuous(self):
         """
-        Run continuous monitoring loop with sleep intervals defined in config.
+        Run continuous monitoring loop, sleeping until the next site is due.
         Stops gracefully on KeyboardInterrupt (Ctrl+C).
         """
         print("Continuous monitoring started (Ctrl+C to stop)\n")
         try:
             while True:
-                self.run_check()
-                interval = self.config.get('check_interval', 3600)
-                print(f"Next check in {interval//60} minutes...\n")
+                self.run_check(scheduled=True)
+                interval = self.seconds_until_next_check()
+                print(f"Next check in {int(interval)//60} minutes...\n")
                 time.sleep(interval)
         except KeyboardInterrupt:
             print("\nMonitoring stopped.")
+        finally:
+            self.session.close()
 
 
 def main():
@@ -474,12 +806,15 @@ def main():
     args = parser.parse_args()
 
     monitor = WebsiteMonitor(args.config)
-    if args.once:
-        monitor.run_check()
-    elif args.continuous:
-        monitor.run_continuous()
-    else:
-        monitor.run_check()
+    try:
+        if args.once:
+            monitor.run_check()
+        elif args.continuous:
+            monitor.run_continuous()
+        else:
+            monitor.run_check()
+    finally:
+        monitor.session.close()
 
 
 if __name__ == "__main__":